@@ -5,14 +5,18 @@ Discovers all .env* files in a project and aggregates their keys
 with priority-based merging and source tracking.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Mapping, Optional
 import json
 import os
+import time
 
 ENV_CACHE_FILE = ".coenv/env_cache.json"
-DEFAULT_PRUNE_DIRS = {
+# Coarsest mtime granularity we expect (FAT, HFS+, some network filesystems)
+_MTIME_GRANULARITY_NS = 2_000_000_000
+DEFAULT_PRUNE_DIRS = frozenset({
     ".git",
     ".coenv",
     "node_modules",
@@ -21,9 +25,15 @@ DEFAULT_PRUNE_DIRS = {
     "__pycache__",
     "dist",
     "build",
+})
+
+# Exact filenames with a fixed priority; other .env.[mode] files get 50
+_FILE_PRIORITIES = {
+    ".env.local": 100,
+    ".env": 0,
 }
 
-from .lexer import parse, get_keys
+from .lexer import parse_keys
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -45,7 +55,7 @@ def _is_excluded(path: Path, root: Path, excluded: set[str]) -> bool:
     return rel_name in excluded
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedKey:
     """Represents a key aggregated from multiple .env files."""
     key: str
@@ -69,17 +79,63 @@ def get_file_priority(filename: str) -> int:
     Returns:
         Priority value (higher = more important)
     """
-    if filename == ".env.local":
-        return 100
-    elif filename == ".env":
-        return 0
-    elif filename.startswith(".env."):
+    priority = _FILE_PRIORITIES.get(filename)
+    if priority is not None:
+        return priority
+    if filename.startswith(".env."):
         # Any .env.[mode] file gets middle priority
         return 50
     return 0
 
 
-def _load_env_cache(project_root: str) -> list[Path] | None:
+def _dir_mtimes(root: Path, rel_dirs) -> dict[str, int | None] | None:
+    mtimes = {}
+    for rel_dir in rel_dirs:
+        try:
+            mtimes[rel_dir] = os.stat(root / rel_dir).st_mtime_ns
+        except OSError:
+            return None
+    return mtimes
+
+
+def _untrust_racy_mtimes(dir_mtimes: dict[str, int | None], scan_start_ns: int) -> None:
+    """
+    Replace mtimes too close to the scan start with None.
+
+    A directory changed within the same timestamp tick as the scan can keep
+    the mtime the scan recorded, so an equal mtime would not prove it is
+    unchanged (git's "racily clean" problem). None never matches a real
+    mtime, so those directories always force a rescan.
+    """
+    cutoff = scan_start_ns - _MTIME_GRANULARITY_NS
+    for rel_dir, mtime in dir_mtimes.items():
+        if mtime is not None and mtime >= cutoff:
+            dir_mtimes[rel_dir] = None
+
+
+def scanned_dirs_unchanged(project_root: str, dir_mtimes: dict[str, int | None]) -> bool:
+    """
+    Check whether every directory a scan visited still has the same mtime.
+
+    Adding, removing or renaming an entry (including a new subdirectory)
+    bumps its parent directory's mtime, so an unchanged set of mtimes means
+    a new scan would find the same env files. Directories modified too close
+    to the scan to be trusted are recorded as None and never count as
+    unchanged.
+
+    Args:
+        project_root: Path to project root directory
+        dir_mtimes: Mapping filled in by discover_env_files
+
+    Returns:
+        True if no scanned directory changed or disappeared
+    """
+    return _dir_mtimes(Path(project_root), dir_mtimes) == dir_mtimes
+
+
+def _load_env_cache(
+    project_root: str, recursive: bool
+) -> tuple[list[Path], dict[str, int | None]] | None:
     cache_path = Path(project_root) / ENV_CACHE_FILE
     if not cache_path.exists():
         return None
@@ -90,20 +146,31 @@ def _load_env_cache(project_root: str) -> list[Path] | None:
 
     if data.get("root") != str(Path(project_root).resolve()):
         return None
+    if data.get("recursive") != recursive:
+        return None
 
-    files = []
-    for rel_path in data.get("files", []):
-        path = Path(project_root) / rel_path
-        if path.exists():
-            files.append(path)
-    return files
+    # Adding or removing an entry changes its directory's mtime, so the
+    # cached list is only trusted while every scanned directory is unchanged
+    dirs = data.get("dirs")
+    if not isinstance(dirs, dict) or not scanned_dirs_unchanged(project_root, dirs):
+        return None
+
+    files = [Path(project_root) / rel_path for rel_path in data.get("files", [])]
+    return files, dirs
 
 
-def _save_env_cache(project_root: str, files: list[Path]) -> None:
+def _save_env_cache(
+    project_root: str,
+    files: list[Path],
+    recursive: bool,
+    dir_mtimes: dict[str, int | None],
+) -> None:
     cache_path = Path(project_root) / ENV_CACHE_FILE
     cache_path.parent.mkdir(exist_ok=True)
     data = {
         "root": str(Path(project_root).resolve()),
+        "recursive": recursive,
+        "dirs": dir_mtimes,
         "files": [str(path.relative_to(project_root)) for path in files],
     }
     try:
@@ -112,11 +179,61 @@ def _save_env_cache(project_root: str, files: list[Path]) -> None:
         pass
 
 
+def _scan_env_files(
+    dirpath: str,
+    root: str,
+    found: list[Path],
+    dir_mtimes: dict[str, int | None],
+) -> None:
+    """
+    Collect .env* files under dirpath, top-down like os.walk.
+
+    Works on os.scandir entries directly so only matching env files become
+    Path objects. Mirrors os.walk(root) semantics: symlinked directories are
+    not followed, unreadable directories are skipped, and a directory's files
+    come before its subdirectories (both in scandir order).
+    """
+    try:
+        dir_mtimes[os.path.relpath(dirpath, root)] = os.stat(dirpath).st_mtime_ns
+    except OSError:
+        pass
+
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                name = entry.name
+                if is_dir:
+                    if name in DEFAULT_PRUNE_DIRS:
+                        continue
+                    try:
+                        is_link = entry.is_symlink()
+                    except OSError:
+                        is_link = True
+                    if not is_link:
+                        subdirs.append(entry.path)
+                elif name.startswith(".env") and name != ".env.example":
+                    files.append(Path(dirpath) / name)
+    except OSError:
+        return
+
+    found.extend(files)
+    for subdir in subdirs:
+        _scan_env_files(subdir, root, found, dir_mtimes)
+
+
 def discover_env_files(
     project_root: str = ".",
     exclude_files: Optional[set[str]] = None,
     recursive: bool | None = None,
     use_cache: bool | None = None,
+    dir_mtimes: Optional[dict[str, int | None]] = None,
 ) -> list[Path]:
     """
     Discover all .env* files in project root.
@@ -130,13 +247,19 @@ def discover_env_files(
         exclude_files: Optional set of filenames or relative paths to skip
         recursive: If True, scan subdirectories (monorepo support)
         use_cache: If True, use cached paths when available
+        dir_mtimes: Optional dict filled with the mtime of every directory
+            the scan covered, keyed by path relative to project_root, for
+            checking later with scanned_dirs_unchanged
 
     Environment:
         COENV_RECURSIVE=0 disables recursive scanning
         COENV_USE_SCAN_CACHE=1 enables cached path usage
 
     Notes:
-        Cached scans are best-effort and may miss newly added env files until refreshed.
+        Cached scans are reused only while every scanned directory keeps its
+        mtime, so adding, removing or renaming an env file triggers a rescan.
+        Directories modified within a couple of seconds of the scan are not
+        trusted, since a change in the same timestamp tick keeps the mtime.
 
     Returns:
         List of Path objects sorted by priority (highest first)
@@ -149,34 +272,34 @@ def discover_env_files(
     if use_cache is None:
         use_cache = _env_bool("COENV_USE_SCAN_CACHE", False)
 
-    if use_cache:
-        cached = _load_env_cache(project_root)
-        if cached is not None:
-            env_files = [path for path in cached if not _is_excluded(path, root, excluded)]
-        else:
-            use_cache = False
+    if dir_mtimes is None:
+        dir_mtimes = {}
 
-    if not use_cache:
-        if recursive:
-            for dirpath, dirnames, filenames in os.walk(root):
-                dirnames[:] = [d for d in dirnames if d not in DEFAULT_PRUNE_DIRS]
+    cached = _load_env_cache(project_root, recursive) if use_cache else None
 
-                for filename in filenames:
-                    if not filename.startswith(".env"):
-                        continue
-                    if filename == ".env.example":
-                        continue
+    if cached is not None:
+        cached_files, cached_dirs = cached
+        dir_mtimes.update(cached_dirs)
+        env_files = [path for path in cached_files if not _is_excluded(path, root, excluded)]
+    else:
+        scan_start_ns = time.time_ns()
 
-                    path = Path(dirpath) / filename
+        # Create the cache directory up front: creating it after the scan
+        # would bump the root's mtime and invalidate the scan straight away
+        (root / ENV_CACHE_FILE).parent.mkdir(exist_ok=True)
 
-                    if ".coenv" in path.parts:
-                        continue
-
-                    if _is_excluded(path, root, excluded):
-                        continue
+        # Every candidate file, before exclusions, so a cached scan stays
+        # valid when the exclusion list changes
+        found = []
 
-                    env_files.append(path)
+        if recursive:
+            # Every path lives under root, and .coenv directories are pruned,
+            # so only a root inside .coenv/ can put files under one
+            if ".coenv" not in root.parts:
+                _scan_env_files(os.fspath(root), os.fspath(root), found, dir_mtimes)
         else:
+            dir_mtimes["."] = os.stat(root).st_mtime_ns
+
             # Find all .env* files in root directory only (not recursive)
             for path in root.iterdir():
                 if not path.is_file():
@@ -196,13 +319,13 @@ def discover_env_files(
                 if ".coenv" in path.parts:
                     continue
 
-                # Skip excluded files by name or relative path
-                if _is_excluded(path, root, excluded):
-                    continue
+                found.append(path)
 
-                env_files.append(path)
+        # Skip excluded files by name or relative path
+        env_files = [path for path in found if not _is_excluded(path, root, excluded)]
 
-        _save_env_cache(project_root, env_files)
+        _untrust_racy_mtimes(dir_mtimes, scan_start_ns)
+        _save_env_cache(project_root, found, recursive, dir_mtimes)
 
     # Sort by priority (highest first)
     env_files.sort(key=lambda p: get_file_priority(p.name), reverse=True)
@@ -210,9 +333,36 @@ def discover_env_files(
     return env_files
 
 
+def _read_fast(path: Path) -> str:
+    """
+    Read a whole file with raw os.read calls, skipping the buffered text layer.
+
+    Env files are small, so this is normally one read sized from fstat plus
+    one to confirm EOF. Newlines are left untranslated; the lexer treats
+    \r\n and \r as line breaks either way.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        bufsize = max(os.fstat(fd).st_size, 65536)
+        chunks = []
+        while True:
+            chunk = os.read(fd, bufsize)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+
+def _load_env_keys(path: Path) -> Mapping[str, str]:
+    return parse_keys(_read_fast(path))
+
+
 def aggregate_env_files(
     files: list[Path],
-    project_root: Optional[str] = None
+    project_root: Optional[str] = None,
+    load_keys: Optional[Callable[[Path], Mapping[str, str]]] = None,
 ) -> dict[str, AggregatedKey]:
     """
     Aggregate keys from multiple .env files with priority-based merging.
@@ -225,22 +375,30 @@ def aggregate_env_files(
     Args:
         files: List of env file paths, sorted by priority (highest first)
         project_root: Optional project root for relative path display
+        load_keys: Optional callable returning the key-value pairs of a file
+            (e.g. a cached reader); defaults to reading and parsing the file
 
     Returns:
         Dictionary mapping key names to AggregatedKey objects
     """
     aggregated: dict[str, AggregatedKey] = {}
     root = Path(project_root) if project_root else None
+    if load_keys is None:
+        load_keys = _load_env_keys
+
+    present = [file_path for file_path in files if file_path.exists()]
+
+    # Overlap file reads when there are enough files to be worth a pool;
+    # results come back in input order, so merging below is unchanged
+    if len(present) > 2:
+        with ThreadPoolExecutor(max_workers=min(8, len(present))) as pool:
+            loaded = list(pool.map(load_keys, present))
+    else:
+        loaded = [load_keys(file_path) for file_path in present]
 
     # Process files in priority order (highest first)
     # First file to define a key "wins" for value/source
-    for file_path in files:
-        if not file_path.exists():
-            continue
-
-        content = file_path.read_text()
-        tokens = parse(content)
-        keys = get_keys(tokens)
+    for file_path, keys in zip(present, loaded):
 
         # Get display name (relative to root or just filename)
         if root:
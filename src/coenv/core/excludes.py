@@ -16,6 +16,10 @@ def parse_exclude_files(content: str) -> Set[str]:
     """
     excluded: Set[str] = set()
 
+    # Most files have no markers at all; skip the per-line scan for them
+    if EXCLUDE_FILE_PREFIX not in content:
+        return excluded
+
     for line in content.splitlines():
         stripped = line.strip()
         if not stripped.startswith("#"):
@@ -8,6 +8,9 @@ This module infers whether a value is:
 """
 
 import math
+import re
+from collections import Counter
+from functools import lru_cache
 from typing import Tuple
 
 
@@ -35,6 +38,17 @@ ENCRYPTED_PREFIXES = [
     'age:',    # age encryption
 ]
 
+# Values with entropy above this are treated as secrets
+ENTROPY_THRESHOLD = 4.5
+
+# Entropy can't exceed log2(len(value)), so anything shorter than this can
+# never clear ENTROPY_THRESHOLD (2**4.5 ~= 22.6)
+_MIN_HIGH_ENTROPY_LEN = math.floor(2 ** ENTROPY_THRESHOLD) + 1
+
+# One anchored alternation per prefix list, compiled once at import
+_SECRET_PREFIX_RE = re.compile('|'.join(map(re.escape, SECRET_PREFIXES)))
+_ENCRYPTED_PREFIX_RE = re.compile('|'.join(map(re.escape, ENCRYPTED_PREFIXES)))
+
 
 def calculate_entropy(value: str) -> float:
     """
@@ -49,19 +63,17 @@ def calculate_entropy(value: str) -> float:
     if not value:
         return 0.0
 
-    # Count frequency of each character
-    freq = {}
-    for char in value:
-        freq[char] = freq.get(char, 0) + 1
+    # Count frequency of each character (tallied in C, first-seen order)
+    freq = Counter(value)
 
     # Calculate entropy
     entropy = 0.0
     length = len(value)
+    log2 = math.log2
 
     for count in freq.values():
         probability = count / length
-        if probability > 0:
-            entropy -= probability * math.log2(probability)
+        entropy -= probability * log2(probability)
 
     return entropy
 
@@ -71,7 +83,7 @@ def is_secret(value: str) -> bool:
     Determine if a value is likely a secret.
 
     A value is considered a secret if:
-    - Entropy > 4.5 (high randomness)
+    - Entropy > ENTROPY_THRESHOLD (high randomness)
     - Starts with a known secret prefix
 
     Args:
@@ -83,17 +95,14 @@ def is_secret(value: str) -> bool:
     if not value:
         return False
 
-    # Check entropy
-    entropy = calculate_entropy(value)
-    if entropy > 4.5:
+    # Check prefixes first: one regex match is far cheaper than entropy
+    if _SECRET_PREFIX_RE.match(value) is not None:
         return True
 
-    # Check prefixes
-    for prefix in SECRET_PREFIXES:
-        if value.startswith(prefix):
-            return True
-
-    return False
+    # Check entropy (skipped when the value is too short to qualify)
+    if len(value) < _MIN_HIGH_ENTROPY_LEN:
+        return False
+    return calculate_entropy(value) > ENTROPY_THRESHOLD
 
 
 def is_encrypted(value: str) -> bool:
@@ -109,15 +118,33 @@ def is_encrypted(value: str) -> bool:
     if not value:
         return False
 
-    for prefix in ENCRYPTED_PREFIXES:
-        if value.startswith(prefix):
-            return True
+    # Also covers the ENC[...] pattern, since 'ENC[' is a listed prefix
+    return _ENCRYPTED_PREFIX_RE.match(value) is not None
 
-    # Check for common encryption patterns
-    if value.startswith('ENC[') and value.endswith(']'):
-        return True
 
-    return False
+@lru_cache(maxsize=4096)
+def _format_placeholder(key: str, encrypted: bool = False) -> str:
+    """Build the <your_key> placeholder; cached since keys repeat across files and syncs."""
+    suffix = "_encrypted" if encrypted else ""
+    return f"<your_{key.lower()}{suffix}>"
+
+
+def _placeholder_for_type(key: str, value: str, value_type: str) -> str:
+    """Placeholder for a value whose type has already been inferred."""
+    if value_type == "encrypted":
+        return _format_placeholder(key, encrypted=True)
+
+    if value_type == "secret":
+        return _format_placeholder(key)
+
+    # Regular value - could expose as-is, but be conservative
+    # Check if it looks like a simple config value
+    if value and len(value) < 50 and not any(char in value for char in ['/', ':', '@', '.']):
+        # Probably a simple config value like "development" or "true"
+        return value
+
+    # Default to placeholder for safety
+    return _format_placeholder(key)
 
 
 def generate_placeholder(key: str, value: str) -> str:
@@ -131,25 +158,7 @@ def generate_placeholder(key: str, value: str) -> str:
     Returns:
         Placeholder string
     """
-    # Convert key to lowercase for placeholder
-    key_lower = key.lower()
-
-    # Check if encrypted
-    if is_encrypted(value):
-        return f"<your_{key_lower}_encrypted>"
-
-    # Check if secret
-    if is_secret(value):
-        return f"<your_{key_lower}>"
-
-    # Regular value - could expose as-is, but be conservative
-    # Check if it looks like a simple config value
-    if value and len(value) < 50 and not any(char in value for char in ['/', ':', '@', '.']):
-        # Probably a simple config value like "development" or "true"
-        return value
-
-    # Default to placeholder for safety
-    return f"<your_{key_lower}>"
+    return _placeholder_for_type(key, value, infer_type(value))
 
 
 def infer_type(value: str) -> str:
@@ -170,6 +179,20 @@ def infer_type(value: str) -> str:
         return "value"
 
 
+def _classify(value: str) -> Tuple[str, float]:
+    """
+    Infer a value's type and entropy with one entropy computation.
+
+    Same result as (infer_type(value), calculate_entropy(value)).
+    """
+    entropy = calculate_entropy(value)
+    if is_encrypted(value):
+        return "encrypted", entropy
+    if _SECRET_PREFIX_RE.match(value) is not None or entropy > ENTROPY_THRESHOLD:
+        return "secret", entropy
+    return "value", entropy
+
+
 def analyze_value(key: str, value: str) -> dict:
     """
     Perform complete analysis of a key-value pair.
@@ -181,15 +204,13 @@ def analyze_value(key: str, value: str) -> dict:
     Returns:
         Dictionary with analysis results
     """
-    value_type = infer_type(value)
-    entropy = calculate_entropy(value)
-    placeholder = generate_placeholder(key, value)
+    value_type, entropy = _classify(value)
 
     return {
         'key': key,
         'type': value_type,
         'entropy': entropy,
-        'placeholder': placeholder,
+        'placeholder': _placeholder_for_type(key, value, value_type),
         'is_secret': value_type in ('secret', 'encrypted'),
         'is_encrypted': value_type == 'encrypted',
     }
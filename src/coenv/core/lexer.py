@@ -6,8 +6,10 @@ all whitespace, comments, and formatting. The constraint is:
     write(parse(file)) == file (byte-identical)
 """
 
+import re
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -19,7 +21,7 @@ class TokenType(Enum):
     EXPORT_PREFIX = "export_prefix"
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """A single token in the .env file."""
     type: TokenType
@@ -35,6 +37,36 @@ class Token:
         return f"Token({self.type.value}, {repr(self.raw[:20])}...)"
 
 
+# Optional export prefix, key up to the first '=', and the rest as value.
+# Whitespace trimming and quote removal are done on the groups afterwards;
+# doing them in the pattern needs lazy quantifiers that backtrack per char.
+_KV_RE = re.compile(r"(export )?([^=]*)=(.*)", re.DOTALL)
+
+
+def _split_key_value(stripped: str) -> Tuple[str, str, bool]:
+    """
+    Split a left-stripped line containing '=' into its parts.
+
+    Args:
+        stripped: Line with leading whitespace removed
+
+    Returns:
+        Tuple of (key, value, has_export)
+    """
+    export, key, value = _KV_RE.match(stripped).groups()
+
+    # Trimming also drops the trailing newline, which stays in raw
+    value = value.strip()
+
+    # Store quoted values without their quotes
+    if value[:1] in ('"', "'") and value.endswith(value[0]):
+        value = value[1:-1]
+
+    # Keys are interned: the same names recur across .env files and end up
+    # in many dicts and sets, where interned strings compare by identity
+    return sys.intern(key.strip()), value, export is not None
+
+
 class Lexer:
     """
     Lossless lexer for .env files.
@@ -54,13 +86,8 @@ class Lexer:
         Returns:
             List of Token objects representing the file structure.
         """
-        tokens = []
-
-        for line in self.lines:
-            token = self._parse_line(line)
-            tokens.append(token)
-
-        return tokens
+        parse_line = self._parse_line
+        return [parse_line(line) for line in self.lines]
 
     def _parse_line(self, line: str) -> Token:
         """Parse a single line into a token."""
@@ -82,38 +109,7 @@ class Lexer:
 
         # Key-value line (potentially with export prefix)
         if '=' in stripped:
-            # Check for export prefix
-            has_export = False
-            working_line = stripped
-
-            if stripped.startswith('export '):
-                has_export = True
-                working_line = stripped[7:]  # Remove 'export '
-
-            # Find the first '=' to split key and value
-            eq_index = working_line.index('=')
-            key = working_line[:eq_index].strip()
-            value = working_line[eq_index + 1:]
-
-            # Remove trailing newline from value for storage
-            # but keep it in raw
-            if value.endswith('\n'):
-                value = value[:-1]
-
-            # Handle quoted values
-            value_stripped = value.strip()
-            if value_stripped:
-                # Check if value is quoted
-                if ((value_stripped.startswith('"') and value_stripped.endswith('"')) or
-                    (value_stripped.startswith("'") and value_stripped.endswith("'"))):
-                    # Store without quotes
-                    value = value_stripped[1:-1]
-                else:
-                    # Store as-is (trimmed)
-                    value = value_stripped
-            else:
-                value = ""
-
+            key, value, has_export = _split_key_value(stripped)
             return Token(
                 type=TokenType.KEY_VALUE,
                 raw=line,
@@ -143,6 +139,29 @@ def parse(content: str) -> List[Token]:
     return lexer.tokenize()
 
 
+def parse_keys(content: str) -> Dict[str, str]:
+    """
+    Extract key-value pairs straight from .env content.
+
+    Equivalent to get_keys(parse(content)) without building the token list.
+
+    Args:
+        content: String content of .env file
+
+    Returns:
+        Dictionary of key-value pairs
+    """
+    keys = {}
+    for line in content.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if not stripped or stripped.startswith('#') or '=' not in stripped:
+            continue
+        key, value, _ = _split_key_value(stripped)
+        if key:
+            keys[key] = value
+    return keys
+
+
 def write(tokens: List[Token]) -> str:
     """
     Reconstruct .env file from tokens.
@@ -153,7 +172,7 @@ def write(tokens: List[Token]) -> str:
     Returns:
         String content that should be byte-identical to original
     """
-    return ''.join(token.raw for token in tokens)
+    return ''.join([token.raw for token in tokens])
 
 
 def get_keys(tokens: List[Token]) -> dict:
@@ -185,30 +204,31 @@ def update_value(tokens: List[Token], key: str, new_value: str) -> List[Token]:
     Returns:
         Updated list of tokens with modified raw text
     """
-    updated = []
-    for token in tokens:
+    # Copy once at C speed and only replace the matching tokens; every
+    # occurrence of a duplicated key is updated, so there is no early exit
+    updated = list(tokens)
+
+    # Quote the value if it contains spaces or special chars
+    if ' ' in new_value or '#' in new_value:
+        quoted_value = f'"{new_value}"'
+    else:
+        quoted_value = new_value
+
+    for index, token in enumerate(tokens):
         if token.type == TokenType.KEY_VALUE and token.key == key:
             # Reconstruct the line with new value
             export_prefix = "export " if token.has_export else ""
             # Preserve the original line ending
             line_ending = '\n' if token.raw.endswith('\n') else ''
 
-            # Quote the value if it contains spaces or special chars
-            if ' ' in new_value or '#' in new_value:
-                quoted_value = f'"{new_value}"'
-            else:
-                quoted_value = new_value
-
             new_raw = f"{export_prefix}{key}={quoted_value}{line_ending}"
 
-            updated.append(Token(
+            updated[index] = Token(
                 type=TokenType.KEY_VALUE,
                 raw=new_raw,
                 key=key,
                 value=new_value,
                 has_export=token.has_export
-            ))
-        else:
-            updated.append(token)
+            )
 
     return updated
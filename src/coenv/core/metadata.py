@@ -12,11 +12,11 @@ import os
 import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyMetadata:
     """Metadata for a single environment variable key."""
     key: str
@@ -28,7 +28,7 @@ class KeyMetadata:
     source: str = ".env"  # Which file this key came from (e.g., ".env.local")
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityLog:
     """Log entry for sync/save activities."""
     timestamp: str
@@ -85,8 +85,11 @@ class MetadataStore:
             for key, meta in self.keys.items()
         }
 
+        # Serialize up front so the file gets one write instead of a write
+        # per JSON fragment.
+        payload = json.dumps(data, indent=2)
         with open(self.metadata_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(payload)
 
     def _load_activity_log(self) -> List[ActivityLog]:
         """Load activity log from disk."""
@@ -104,8 +107,9 @@ class MetadataStore:
         """Save activity log to disk."""
         data = [asdict(entry) for entry in self.activity_log]
 
+        payload = json.dumps(data, indent=2)
         with open(self.activity_log_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(payload)
 
     def get_git_user(self) -> str:
         """
@@ -138,31 +142,45 @@ class MetadataStore:
             user: User name (defaults to git user)
             source: Source file name (e.g., ".env.local")
         """
+        self.track_keys_bulk([(key, source)], user=user)
+
+    def track_keys_bulk(self, items: Iterable[Tuple[str, str]], user: Optional[str] = None):
+        """
+        Track or update metadata for many keys with a single save.
+
+        Args:
+            items: (key, source) pairs
+            user: User name (defaults to git user, looked up once)
+        """
         if user is None:
             user = self.get_git_user()
 
         now = datetime.now().isoformat()
-
-        if key in self.keys:
-            # Update existing key
-            meta = self.keys[key]
-            meta.last_modified = now
-            meta.last_modified_by = user
-            meta.sync_count += 1
-            meta.source = source  # Update source to current file
-        else:
-            # New key
-            self.keys[key] = KeyMetadata(
-                key=key,
-                owner=user,
-                created_at=now,
-                last_modified=now,
-                last_modified_by=user,
-                sync_count=1,
-                source=source
-            )
-
-        self._save_metadata()
+        tracked = False
+
+        for key, source in items:
+            tracked = True
+            if key in self.keys:
+                # Update existing key
+                meta = self.keys[key]
+                meta.last_modified = now
+                meta.last_modified_by = user
+                meta.sync_count += 1
+                meta.source = source  # Update source to current file
+            else:
+                # New key
+                self.keys[key] = KeyMetadata(
+                    key=key,
+                    owner=user,
+                    created_at=now,
+                    last_modified=now,
+                    last_modified_by=user,
+                    sync_count=1,
+                    source=source
+                )
+
+        if tracked:
+            self._save_metadata()
 
     def log_activity(self, action: str, keys_affected: int, user: Optional[str] = None):
         """
@@ -198,6 +216,19 @@ class MetadataStore:
         """
         return self.keys.get(key)
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, KeyMetadata]:
+        """
+        Get metadata for several keys at once.
+
+        Args:
+            keys: Environment variable keys
+
+        Returns:
+            Dictionary of key -> KeyMetadata for keys that have metadata
+        """
+        store = self.keys
+        return {key: store[key] for key in keys if key in store}
+
     def get_weekly_summary(self) -> Dict:
         """
         Get summary of activity for the current week.
@@ -11,6 +11,8 @@ Key features:
 """
 
 import difflib
+import re
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Dict, Set, Tuple, Optional, TYPE_CHECKING
 from .lexer import Token, TokenType, parse, write, get_keys, update_value
@@ -24,8 +26,135 @@ DEPRECATED_MARKER = "# === DEPRECATED ==="
 TOMBSTONE_PREFIX = "[TOMBSTONE]"
 FUZZY_MATCH_THRESHOLD = 0.6
 
+_DEPRECATED_ON = "- Deprecated on:"
+# "# [TOMBSTONE] KEY - Deprecated on: DATE", with the same whitespace rules
+# as stripping the line: group 1 is the key part, group 2 the date part
+_TOMBSTONE_RE = re.compile(
+    r"\s*#\s*" + re.escape(TOMBSTONE_PREFIX) + r"(.*?)" + re.escape(_DEPRECATED_ON) + r"(.*)",
+    re.DOTALL,
+)
 
-def find_fuzzy_match(key: str, candidates: List[str], threshold: float = FUZZY_MATCH_THRESHOLD) -> Optional[str]:
+
+@lru_cache(maxsize=None)
+def _rapidfuzz():
+    """
+    rapidfuzz's (process, Indel), or None when it isn't installed.
+
+    Imported on first use so commands that never fuzzy-match don't pay for
+    it at startup. Optional speedup (pip install coenv[speedups]).
+    """
+    try:
+        from rapidfuzz import process
+        from rapidfuzz.distance import Indel
+    except ImportError:
+        return None
+    return process, Indel
+
+
+def _lower_len(text: str) -> int:
+    """len(text.lower()) without the copy for ASCII text, where they're equal."""
+    return len(text) if text.isascii() else len(text.lower())
+
+
+def _length_bound(len_a: int, len_b: int) -> float:
+    """
+    Upper bound on ``SequenceMatcher.ratio()`` from string lengths alone.
+
+    ratio() is 2*matches/total and matches can't exceed the shorter string.
+    """
+    total = len_a + len_b
+    return 2.0 * min(len_a, len_b) / total if total else 1.0
+
+
+def _best_first_match(
+    key_lower: str,
+    candidates: List[str],
+    candidates_lower: Optional[List[str]],
+    threshold: float,
+) -> Optional[str]:
+    """
+    Branch-and-bound search for the best difflib match (rapidfuzz path).
+
+    SequenceMatcher's matching blocks form a common subsequence, so its match
+    count never exceeds the longest common subsequence, which rapidfuzz's
+    Indel distance gives us in C for all candidates in one call. That turns
+    each candidate into an upper bound on its ratio(), computed the same way
+    ratio() is. Candidates are then scored with difflib best bound first,
+    stopping as soon as no remaining bound can beat (or tie with an earlier
+    candidate than) the current best - the same answer as the plain loop.
+    """
+    key_len = len(key_lower)
+
+    # Length alone bounds ratio() by 2*min/total (see _length_bound); only
+    # candidates that clear it are lowercased and handed to rapidfuzz
+    if candidates_lower is not None:
+        kept = [
+            index for index, candidate_lower in enumerate(candidates_lower)
+            if _length_bound(key_len, len(candidate_lower)) > threshold
+        ]
+        lowered = [candidates_lower[index] for index in kept]
+    else:
+        kept = [
+            index for index, candidate in enumerate(candidates)
+            if _length_bound(key_len, _lower_len(candidate)) > threshold
+        ]
+        lowered = [candidates[index].lower() for index in kept]
+
+    # A case-insensitive exact match scores 1.0, which nothing later can
+    # beat, so the first one wins without running any comparisons. Equal
+    # lengths always clear the length bound, so it is among the kept ones.
+    if key_lower in lowered:
+        return candidates[kept[lowered.index(key_lower)]]
+
+    # A candidate can only clear the threshold if its normalized Indel
+    # distance is below 1 - threshold. Passing that as score_cutoff lets
+    # rapidfuzz use its bounded algorithms and give up early on hopeless
+    # pairs. The epsilon keeps float rounding from dropping a borderline
+    # candidate; the exact bound is recomputed from the integer distance.
+    # processor=None matters: rapidfuzz 2.x defaults extract() to
+    # default_process, which would bound different strings than difflib sees.
+    cutoff = min(1.0, max(0.0, 1.0 - threshold + 1e-9))
+
+    bounded = []
+    process, indel = _rapidfuzz()
+    for candidate_lower, normalized, position in process.extract(
+        key_lower, lowered, scorer=indel.normalized_distance,
+        processor=None, limit=None, score_cutoff=cutoff,
+    ):
+        length = key_len + len(candidate_lower)
+        distance = round(normalized * length)
+        bound = 2.0 * ((length - distance) // 2) / length if length else 1.0
+        if bound > threshold:
+            bounded.append((bound, kept[position], candidate_lower))
+    bounded.sort(key=lambda item: (-item[0], item[1]))
+
+    # One matcher for the whole search: the key stays as sequence a and
+    # only the candidate side is swapped in per comparison
+    matcher = difflib.SequenceMatcher(None, key_lower)
+    best_index = None
+    best_ratio = threshold
+    for bound, index, candidate_lower in bounded:
+        if bound < best_ratio:
+            break
+        if best_index is not None and bound == best_ratio and index > best_index:
+            continue
+        matcher.set_seq2(candidate_lower)
+        ratio = matcher.ratio()
+        if ratio > best_ratio or (
+            best_index is not None and ratio == best_ratio and index < best_index
+        ):
+            best_ratio = ratio
+            best_index = index
+
+    return candidates[best_index] if best_index is not None else None
+
+
+def find_fuzzy_match(
+    key: str,
+    candidates: List[str],
+    threshold: float = FUZZY_MATCH_THRESHOLD,
+    candidates_lower: Optional[List[str]] = None,
+) -> Optional[str]:
     """
     Find the best fuzzy match for a key among candidates.
 
@@ -33,6 +162,8 @@ def find_fuzzy_match(key: str, candidates: List[str], threshold: float = FUZZY_M
         key: Key to match
         candidates: List of candidate keys
         threshold: Minimum similarity ratio (default 0.8)
+        candidates_lower: Optional lowercased candidates, parallel to
+            candidates, for callers matching many keys against one list
 
     Returns:
         Best matching key or None if no match above threshold
@@ -40,11 +171,39 @@ def find_fuzzy_match(key: str, candidates: List[str], threshold: float = FUZZY_M
     if not candidates:
         return None
 
+    key_lower = key.lower()
+    if _rapidfuzz() is not None:
+        return _best_first_match(key_lower, candidates, candidates_lower, threshold)
+
+    # A case-insensitive exact match scores 1.0, which nothing later can
+    # beat, so the first one wins without running any comparisons
+    if threshold < 1.0 and candidates_lower is not None and key_lower in candidates_lower:
+        return candidates[candidates_lower.index(key_lower)]
+
+    matcher = difflib.SequenceMatcher(None, key_lower)
     best_match = None
     best_ratio = threshold
-
-    for candidate in candidates:
-        ratio = difflib.SequenceMatcher(None, key.lower(), candidate.lower()).ratio()
+    key_len = len(key_lower)
+
+    for index, candidate in enumerate(candidates):
+        # Very different lengths rule a candidate out before it is even
+        # lowercased
+        if candidates_lower is not None:
+            candidate_lower = candidates_lower[index]
+            if _length_bound(key_len, len(candidate_lower)) <= best_ratio:
+                continue
+        else:
+            if _length_bound(key_len, _lower_len(candidate)) <= best_ratio:
+                continue
+            candidate_lower = candidate.lower()
+            if candidate_lower == key_lower:
+                return candidate
+        matcher.set_seq2(candidate_lower)
+        # quick_ratio() bounds ratio() from above using character counts
+        # alone, ruling out most candidates without finding matching blocks
+        if matcher.quick_ratio() <= best_ratio:
+            continue
+        ratio = matcher.ratio()
         if ratio > best_ratio:
             best_ratio = ratio
             best_match = candidate
@@ -52,6 +211,23 @@ def find_fuzzy_match(key: str, candidates: List[str], threshold: float = FUZZY_M
     return best_match
 
 
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a tombstone date as strptime(date_str, '%Y-%m-%d') would.
+
+    Canonical YYYY-MM-DD dates take the fast fromisoformat path; anything
+    else (e.g. 2024-1-5, which strptime also accepts) goes through strptime.
+    """
+    try:
+        if (len(date_str) == 10 and date_str[4] == date_str[7] == '-'
+                and date_str.isascii()
+                and (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()):
+            return datetime.fromisoformat(date_str)
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        return None
+
+
 def parse_tombstone(comment_line: str) -> Optional[Tuple[str, datetime]]:
     """
     Parse a tombstone comment to extract key and deprecation date.
@@ -64,29 +240,23 @@ def parse_tombstone(comment_line: str) -> Optional[Tuple[str, datetime]]:
     Returns:
         Tuple of (key, deprecation_date) or None if not a tombstone
     """
-    if not comment_line.strip().startswith('#'):
+    # Most comments are not tombstones; a substring test rejects them
+    # without running the regex
+    if TOMBSTONE_PREFIX not in comment_line:
         return None
 
-    # Remove leading '#' and whitespace
-    content = comment_line.strip()[1:].strip()
-
-    if not content.startswith(TOMBSTONE_PREFIX):
+    match = _TOMBSTONE_RE.fullmatch(comment_line)
+    if match is None:
         return None
 
-    # Remove tombstone prefix
-    content = content[len(TOMBSTONE_PREFIX):].strip()
+    key = match.group(1).strip()
+    # The date runs up to any further marker, as a split on it would give
+    date_str = match.group(2).split(_DEPRECATED_ON, 1)[0].strip()
 
-    if '- Deprecated on:' not in content:
-        return None
-
-    try:
-        parts = content.split('- Deprecated on:')
-        key = parts[0].strip()
-        date_str = parts[1].strip()
-        deprecation_date = datetime.strptime(date_str, '%Y-%m-%d')
-        return (key, deprecation_date)
-    except (ValueError, IndexError):
+    deprecation_date = _parse_date(date_str)
+    if deprecation_date is None:
         return None
+    return (key, deprecation_date)
 
 
 def get_tombstoned_keys(tokens: List[Token]) -> Set[str]:
@@ -103,12 +273,16 @@ def get_tombstoned_keys(tokens: List[Token]) -> Set[str]:
     in_deprecated = False
 
     for token in tokens:
-        if token.type == TokenType.COMMENT and DEPRECATED_MARKER in token.raw:
+        if token.type != TokenType.COMMENT:
+            continue
+
+        raw = token.raw
+        if DEPRECATED_MARKER in raw:
             in_deprecated = True
             continue
 
-        if in_deprecated and token.type == TokenType.COMMENT:
-            entry = parse_tombstone(token.raw)
+        if in_deprecated:
+            entry = parse_tombstone(raw)
             if entry:
                 key, _ = entry
                 tombstoned.add(key)
@@ -116,6 +290,48 @@ def get_tombstoned_keys(tokens: List[Token]) -> Set[str]:
     return tombstoned
 
 
+def scan_keys_and_tombstones(content: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Collect active keys and tombstoned keys straight from file content.
+
+    Equivalent to ``set(get_keys(parse(content)))`` and
+    ``get_tombstoned_keys(parse(content))``, but walks the lines once
+    without building Token objects.
+
+    Args:
+        content: .env.example content
+
+    Returns:
+        Tuple of (active keys, tombstoned keys)
+    """
+    keys = set()
+    tombstoned = set()
+    in_deprecated = False
+
+    for line in content.splitlines():
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+
+        # Comment (or unparseable) line - same rules as the lexer
+        if stripped.startswith('#') or '=' not in stripped:
+            if DEPRECATED_MARKER in line:
+                in_deprecated = True
+            elif in_deprecated:
+                entry = parse_tombstone(line)
+                if entry:
+                    tombstoned.add(entry[0])
+            continue
+
+        if stripped.startswith('export '):
+            stripped = stripped[7:]
+        key = stripped[:stripped.index('=')].strip()
+        if key:
+            keys.add(key)
+
+    return keys, tombstoned
+
+
 def find_fuzzy_tombstone_matches(
     new_keys: Set[str],
     tombstoned_keys: Set[str],
@@ -135,9 +351,11 @@ def find_fuzzy_tombstone_matches(
         Dict mapping new_key -> matched_tombstone_key
     """
     matches = {}
+    candidates = list(tombstoned_keys)
+    candidates_lower = [key.lower() for key in candidates]
 
     for new_key in new_keys:
-        match = find_fuzzy_match(new_key, list(tombstoned_keys), threshold)
+        match = find_fuzzy_match(new_key, candidates, threshold, candidates_lower)
         if match:
             matches[new_key] = match
 
@@ -161,20 +379,18 @@ def add_tombstone(content: str, key: str) -> str:
     tokens = parse(content)
     today = datetime.now().strftime('%Y-%m-%d')
 
-    # Remove the key from active section if it exists
+    # Remove the key from active section if it exists, noting where the
+    # deprecated section starts in the same pass
     new_tokens = []
+    deprecated_index = None
     for token in tokens:
         if token.type == TokenType.KEY_VALUE and token.key == key:
             continue  # Skip this key - it's being tombstoned
+        if (deprecated_index is None and token.type == TokenType.COMMENT
+                and DEPRECATED_MARKER in token.raw):
+            deprecated_index = len(new_tokens)
         new_tokens.append(token)
 
-    # Check if deprecated section exists
-    deprecated_index = None
-    for i, token in enumerate(new_tokens):
-        if token.type == TokenType.COMMENT and DEPRECATED_MARKER in token.raw:
-            deprecated_index = i
-            break
-
     tombstone_comment = f"# {TOMBSTONE_PREFIX} {key} - Deprecated on: {today}\n"
 
     if deprecated_index is None:
@@ -206,18 +422,24 @@ def remove_tombstone(content: str, key: str) -> str:
     """
     tokens = parse(content)
 
+    # Drop the tombstone and track whether any others remain in the
+    # deprecated section (same rules as get_tombstoned_keys) in one pass
     new_tokens = []
+    in_deprecated = False
+    has_remaining = False
     for token in tokens:
         if token.type == TokenType.COMMENT:
-            entry = parse_tombstone(token.raw)
+            raw = token.raw
+            entry = parse_tombstone(raw)
             if entry and entry[0] == key:
                 continue  # Skip this tombstone
+            if DEPRECATED_MARKER in raw:
+                in_deprecated = True
+            elif entry and in_deprecated:
+                has_remaining = True
         new_tokens.append(token)
 
-    # Check if any tombstones remain
-    remaining_tombstones = get_tombstoned_keys(new_tokens)
-
-    if not remaining_tombstones:
+    if not has_remaining:
         # Remove the deprecated marker and any trailing blank lines before it
         final_tokens = []
         for token in new_tokens:
@@ -319,10 +541,17 @@ class Syncer:
         # Get tombstoned keys (these will be skipped)
         tombstoned_keys = get_tombstoned_keys(self.example_tokens)
 
+        # Rename candidates: env keys not yet claimed, in env order, with
+        # their lowercased forms computed once. Claimed keys are popped as
+        # they are consumed.
+        remaining_lower = {key: key.lower() for key in self.env_keys}
+
         # Step 1: Update existing keys and detect renames
         updated_keys = set()
         seen_keys = set()
         new_tokens = []
+        # Where the deprecated section starts in new_tokens, noted in passing
+        deprecated_index = None
 
         for token in self.example_tokens:
             if token.type == TokenType.KEY_VALUE and token.key:
@@ -356,10 +585,14 @@ class Syncer:
                         new_tokens.append(updated)
 
                     updated_keys.add(token.key)
+                    remaining_lower.pop(token.key, None)
                 else:
                     # Key doesn't exist in env files - check for fuzzy rename
-                    remaining_env_keys = [k for k in self.env_keys.keys() if k not in updated_keys]
-                    fuzzy_match = find_fuzzy_match(token.key, remaining_env_keys)
+                    fuzzy_match = find_fuzzy_match(
+                        token.key,
+                        list(remaining_lower),
+                        candidates_lower=list(remaining_lower.values()),
+                    )
 
                     if fuzzy_match:
                         # Rename detected - update key and value
@@ -373,45 +606,41 @@ class Syncer:
                         )
                         new_tokens.append(renamed)
                         updated_keys.add(fuzzy_match)
+                        del remaining_lower[fuzzy_match]
                     else:
                         # Keep existing key when missing locally (union behavior)
                         new_tokens.append(token)
             else:
                 # Non-key-value token - keep as-is (includes comments, blanks, tombstones)
+                if (deprecated_index is None and token.type == TokenType.COMMENT
+                        and DEPRECATED_MARKER in token.raw):
+                    deprecated_index = len(new_tokens)
                 new_tokens.append(token)
 
         # Step 2: Add new keys from .env (excluding tombstoned keys)
-        new_keys = set(self.env_keys.keys()) - updated_keys - tombstoned_keys
+        new_keys = self.env_keys.keys() - updated_keys - tombstoned_keys
 
         if new_keys:
-            # Add before deprecated section if it exists, otherwise at end
-            deprecated_index = self._find_deprecated_index(new_tokens)
-
+            added_tokens = []
             for key in sorted(new_keys):
                 value = generate_placeholder(key, self.env_keys[key])
-                new_token = Token(
+                added_tokens.append(Token(
                     type=TokenType.KEY_VALUE,
                     raw=self._reconstruct_line(key, value, False),
                     key=key,
                     value=value,
                     has_export=False
-                )
+                ))
 
-                if deprecated_index is not None:
-                    new_tokens.insert(deprecated_index, new_token)
-                    deprecated_index += 1
-                else:
-                    new_tokens.append(new_token)
+            # Add before deprecated section if it exists, otherwise at end,
+            # splicing them in with one slice assignment
+            if deprecated_index is not None:
+                new_tokens[deprecated_index:deprecated_index] = added_tokens
+            else:
+                new_tokens.extend(added_tokens)
 
         return write(new_tokens)
 
-    def _find_deprecated_index(self, tokens: List[Token]) -> Optional[int]:
-        """Find the index of the deprecated section marker."""
-        for i, token in enumerate(tokens):
-            if token.type == TokenType.COMMENT and DEPRECATED_MARKER in token.raw:
-                return i
-        return None
-
     def _reconstruct_line(self, key: str, value: str, has_export: bool) -> str:
         """Reconstruct a key-value line."""
         export_prefix = "export " if has_export else ""
@@ -4,28 +4,42 @@ CoEnv CLI - Collaborative Environment Manager
 Main entry point for the coenv command-line tool.
 """
 
+import bisect
 import click
+import os
 import sys
 import subprocess
 import re
+import threading
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
+from typing import Iterable
 
 from .core.lexer import parse, get_keys, write, Token, TokenType
 from .core.excludes import parse_exclude_files, EXCLUDE_FILE_PREFIX
 from .core.syncer import (
     sync_aggregated, add_tombstone, remove_tombstone,
-    get_tombstoned_keys, find_fuzzy_tombstone_matches, DEPRECATED_MARKER
+    get_tombstoned_keys, find_fuzzy_tombstone_matches, scan_keys_and_tombstones,
+    DEPRECATED_MARKER
 )
 from .core.discovery import discover_env_files, aggregate_env_files, get_example_path
 from .core.metadata import MetadataStore
 from .core import telemetry
 
 
-console = Console()
+class _LazyConsole:
+    """Console proxy that defers importing rich until something is printed."""
+
+    def __init__(self):
+        self._console = None
+
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
 
 
 def find_env_files(project_root: str = ".") -> tuple:
@@ -79,6 +93,9 @@ def display_friday_pulse(metadata: MetadataStore):
     if not metadata.should_show_friday_pulse():
         return
 
+    from rich.panel import Panel
+    from rich import box
+
     summary = metadata.get_weekly_summary()
 
     if summary['syncs'] == 0 and summary['saves'] == 0:
@@ -104,88 +121,165 @@ Active users: {summary['user_count']} ({', '.join(summary['active_users'])})
     metadata.mark_pulse_shown()
 
 
-def _git_show_file(project_root: str, ref: str, path: str) -> str | None:
-    """Read a file from a git ref; return None if not found."""
+def _parse_cat_file_batch(output: bytes, count: int) -> list[str | None]:
+    """
+    Split 'git cat-file --batch' output into the contents of count objects.
+
+    Each reply is "<oid> <type> <size>" followed by that many bytes and a
+    newline, or a single "<object> missing" line. Missing objects and
+    replies cut short come back as None.
+    """
+    contents: list[str | None] = []
+    pos = 0
+    for _ in range(count):
+        header_end = output.find(b"\n", pos)
+        if header_end == -1:
+            contents.append(None)
+            continue
+
+        header = output[pos:header_end].split()
+        pos = header_end + 1
+        if len(header) != 3 or not header[2].isdigit():
+            contents.append(None)
+            continue
+
+        size = int(header[2])
+        contents.append(output[pos:pos + size].decode("utf-8", errors="replace"))
+        pos += size + 1  # Content is followed by a newline
+
+    return contents
+
+
+def _git_show_files(project_root: str, objects: list[str]) -> list[str | None]:
+    """
+    Read several objects (e.g. "<ref>:<path>") with a single git cat-file --batch call.
+
+    All requests are written up front and the responses read back in order.
+    Missing refs or paths come back as None instead of failing the batch.
+    """
+    request = "".join(f"{obj}\n" for obj in objects).encode()
     try:
         result = subprocess.run(
-            ["git", "show", f"{ref}:{path}"],
+            ["git", "cat-file", "--batch"],
             cwd=project_root,
+            input=request,
             capture_output=True,
-            text=True,
             timeout=2,
         )
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return None
+    except (subprocess.TimeoutExpired, OSError):
+        return [None] * len(objects)
 
     if result.returncode != 0:
-        return None
+        return [None] * len(objects)
+
+    return _parse_cat_file_batch(result.stdout, len(objects))
 
-    return result.stdout
 
+def _parse_blame_incremental(lines: Iterable[str]) -> dict[int, str]:
+    """
+    Map line numbers (1-based) to authors from 'git blame --incremental' output.
+
+    Each group starts with "<sha> <orig_line> <final_line> <num_lines>" and
+    ends with a "filename" line. A commit's "author" header only appears in
+    the first group for that commit, so authors are remembered per commit.
+    Groups cut off before their "filename" line are ignored.
+    """
+    authors: dict[int, str] = {}
+    commit_authors: dict[str, str] = {}
+    commit = None
+    first_line = line_count = 0
+
+    for line in lines:
+        if commit is None:
+            # Group header: "<sha> <orig_line> <final_line> <num_lines>"
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            commit, first_line, line_count = parts[0], int(parts[2]), int(parts[3])
+        elif line.startswith("author "):
+            commit_authors[commit] = line[len("author "):].strip() or "unknown"
+        elif line.startswith("filename "):
+            # End of group: attribute its line range to the commit's author
+            author = commit_authors.get(commit, "unknown")
+            for line_no in range(first_line, first_line + line_count):
+                authors[line_no] = author
+            commit = None
+
+    return authors
+
+
+def _git_blame_authors(
+    project_root: str, ref: str | None, path: str, timeout: float = 2
+) -> dict[int, str]:
+    """
+    Map every line of a file (1-based) to its author using git blame.
+
+    Parses --incremental output as it streams. If git blame is still running
+    after timeout seconds it is killed, and the lines attributed so far are
+    kept; callers treat the rest as unknown.
+    """
+    cmd = ["git", "blame", "--incremental"]
+    if ref:
+        cmd.append(ref)
+    cmd.extend(["--", path])
 
-def _git_ref_exists(project_root: str, ref: str) -> bool:
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--verify", ref],
+        proc = subprocess.Popen(
+            cmd,
             cwd=project_root,
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=2,
         )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+    except (OSError, ValueError):
+        return {}
+
+    # Killing the process closes its stdout, which ends the parse below
+    timed_out = threading.Event()
 
+    def kill() -> None:
+        timed_out.set()
+        proc.kill()
 
-def _git_blame_author(project_root: str, ref: str | None, path: str, line_no: int) -> str:
-    """Return the author for a specific line using git blame."""
+    timer = threading.Timer(timeout, kill)
+    timer.start()
     try:
-        cmd = ["git", "blame", "-L", f"{line_no},{line_no}", "--line-porcelain"]
-        if ref:
-            cmd.extend([ref, "--", path])
-        else:
-            cmd.extend(["--", path])
+        with proc:
+            authors = _parse_blame_incremental(proc.stdout)
+    finally:
+        timer.cancel()
 
-        result = subprocess.run(
-            cmd,
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return "unknown"
+    if proc.returncode != 0 and not timed_out.is_set():
+        return {}
 
-    if result.returncode != 0:
-        return "unknown"
+    return authors
+
+
+_KEY_LINE_RE = re.compile(r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)=", re.MULTILINE)
+_TOMBSTONE_LINE_RE = re.compile(
+    r"^[ \t]*#[ \t]*\[TOMBSTONE\][ \t]+([A-Za-z_][A-Za-z0-9_]*)[ \t]+-[ \t]+Deprecated on:",
+    re.MULTILINE,
+)
 
-    for line in result.stdout.splitlines():
-        if line.startswith("author "):
-            return line[len("author "):].strip() or "unknown"
 
-    return "unknown"
+def _line_map(pattern: re.Pattern, content: str) -> dict[str, int]:
+    """Map the first group of each pattern match to its line number (1-based)."""
+    newlines = [match.start() for match in re.finditer("\n", content)]
+    return {
+        match.group(1): bisect.bisect_left(newlines, match.start()) + 1
+        for match in pattern.finditer(content)
+    }
 
 
 def _line_map_keys(content: str) -> dict[str, int]:
     """Map env keys to line numbers (1-based)."""
-    mapping: dict[str, int] = {}
-    key_re = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)=")
-    for idx, line in enumerate(content.splitlines(), start=1):
-        match = key_re.match(line)
-        if match:
-            mapping[match.group(1)] = idx
-    return mapping
+    return _line_map(_KEY_LINE_RE, content)
 
 
 def _line_map_tombstones(content: str) -> dict[str, int]:
     """Map tombstoned keys to line numbers (1-based)."""
-    mapping: dict[str, int] = {}
-    tombstone_re = re.compile(r"^\s*#\s*\[TOMBSTONE\]\s+([A-Za-z_][A-Za-z0-9_]*)\s+-\s+Deprecated on:")
-    for idx, line in enumerate(content.splitlines(), start=1):
-        match = tombstone_re.match(line)
-        if match:
-            mapping[match.group(1)] = idx
-    return mapping
+    return _line_map(_TOMBSTONE_LINE_RE, content)
 
 
 def _has_conflict_markers(content: str) -> bool:
@@ -222,22 +316,25 @@ def report_example_changes(project_root: str = ".") -> None:
     """
     Report .env.example changes from the last merge/rewrite.
     """
-    base_ref = "ORIG_HEAD" if _git_ref_exists(project_root, "ORIG_HEAD") else "HEAD@{1}"
-    if not _git_ref_exists(project_root, base_ref):
-        return
-
-    base_content = _git_show_file(project_root, base_ref, ".env.example")
-    head_content = _git_show_file(project_root, "HEAD", ".env.example")
+    # ORIG_HEAD itself is requested too, so "ORIG_HEAD exists but has no
+    # .env.example" (the merge introduced it) stays distinct from "no
+    # ORIG_HEAD", the only case that falls back to HEAD@{1}
+    orig_ref, orig_content, reflog_content, head_content = _git_show_files(
+        project_root,
+        [
+            "ORIG_HEAD",
+            "ORIG_HEAD:.env.example",
+            "HEAD@{1}:.env.example",
+            "HEAD:.env.example",
+        ],
+    )
+    base_content = orig_content if orig_ref is not None else reflog_content
 
     if base_content is None or head_content is None:
         return
 
-    base_tokens = parse(base_content)
-    head_tokens = parse(head_content)
-    base_keys = set(get_keys(base_tokens).keys())
-    head_keys = set(get_keys(head_tokens).keys())
-    base_tombstones = get_tombstoned_keys(base_tokens)
-    head_tombstones = get_tombstoned_keys(head_tokens)
+    base_keys, base_tombstones = scan_keys_and_tombstones(base_content)
+    head_keys, head_tombstones = scan_keys_and_tombstones(head_content)
 
     added_keys = head_keys - base_keys
     removed_keys = base_keys - head_keys
@@ -250,6 +347,11 @@ def report_example_changes(project_root: str = ".") -> None:
 
     key_line_map = _line_map_keys(head_content)
     tombstone_line_map = _line_map_tombstones(head_content)
+    blame_authors = (
+        _git_blame_authors(project_root, None, ".env.example")
+        if added_keys or new_tombstones
+        else {}
+    )
 
     console.print("\n[bold]CoEnv changes from merge[/bold]")
 
@@ -257,14 +359,14 @@ def report_example_changes(project_root: str = ".") -> None:
         console.print("[green]Added keys:[/green]")
         for key in sorted(added_keys):
             line_no = key_line_map.get(key)
-            owner = _git_blame_author(project_root, None, ".env.example", line_no) if line_no else "unknown"
+            owner = blame_authors.get(line_no, "unknown")
             console.print(f"  [green]+ {key}[/green] [dim](owner: {owner})[/dim]")
 
     if new_tombstones:
         console.print("[yellow]Deprecated keys:[/yellow]")
         for key in sorted(new_tombstones):
             line_no = tombstone_line_map.get(key)
-            owner = _git_blame_author(project_root, None, ".env.example", line_no) if line_no else "unknown"
+            owner = blame_authors.get(line_no, "unknown")
             console.print(f"  [yellow]~ {key}[/yellow] [dim](owner: {owner})[/dim]")
 
     if removed_keys:
@@ -332,16 +434,34 @@ def status(project_root):
     console.print()
 
     # Parse .env.example if it exists
-    example_keys = {}
+    example_keys = set()
     tombstoned = set()
     example_line_map = {}
     if Path(example_path).exists():
         with open(example_path, 'r') as f:
             example_content = f.read()
-        example_keys = get_keys(parse(example_content))
-        tombstoned = get_tombstoned_keys(parse(example_content))
+        example_keys, tombstoned = scan_keys_and_tombstones(example_content)
         example_line_map = _line_map_keys(example_content)
 
+    # Resolve owners up front: one blame for keys in .env.example, one
+    # metadata lookup batch for the rest.
+    keys = sorted(aggregated_keys)
+    blame_authors = (
+        _git_blame_authors(project_root, None, ".env.example")
+        if example_line_map
+        else {}
+    )
+    key_metadata = metadata.get_many(key for key in keys if key not in example_line_map)
+    owners = [
+        blame_authors.get(example_line_map[key], "unknown")
+        if key in example_line_map
+        else key_metadata[key].owner if key in key_metadata else "unknown"
+        for key in keys
+    ]
+
+    from rich.table import Table
+    from rich import box
+
     # Create status table
     table = Table(title="Environment Variable Status", box=box.ROUNDED)
     table.add_column("Key", style="cyan", no_wrap=True)
@@ -350,7 +470,7 @@ def status(project_root):
     table.add_column("Health", style="green")
     table.add_column("Owner", style="yellow")
 
-    for key in sorted(aggregated_keys.keys()):
+    for key, owner in zip(keys, owners):
         agg_key = aggregated_keys[key]
         value = agg_key.value
         source = agg_key.source
@@ -369,14 +489,6 @@ def status(project_root):
         else:
             health = "✓ Set"
 
-        # Get owner
-        line_no = example_line_map.get(key)
-        if line_no:
-            owner = _git_blame_author(project_root, None, ".env.example", line_no)
-        else:
-            key_meta = metadata.get_key_metadata(key)
-            owner = key_meta.owner if key_meta else "unknown"
-
         table.add_row(key, source, repo_status, health, owner)
 
     console.print(table)
@@ -441,15 +553,18 @@ def commit_hook(project_root):
     # Check for tombstoned keys before sync
     tombstoned = set()
     example_keys_set = set()
+    example_content = None
+    example_on_disk = None
     if Path(example_path).exists():
-        with open(example_path, 'r') as f:
-            example_content = f.read()
-        example_tokens = parse(example_content)
-        tombstoned = get_tombstoned_keys(example_tokens)
-        example_keys_set = set(get_keys(example_tokens).keys())
+        # Read without newline translation so the write check below sees the
+        # file's real line endings; translate the way text mode would
+        with open(example_path, 'r', newline='') as f:
+            example_on_disk = f.read()
+        example_content = example_on_disk.replace('\r\n', '\n').replace('\r', '\n')
+        example_keys_set, tombstoned = scan_keys_and_tombstones(example_content)
 
         # Exact match blocked keys
-        blocked_keys = set(aggregated_keys.keys()) & tombstoned
+        blocked_keys = aggregated_keys.keys() & tombstoned
         if blocked_keys:
             console.print(f"\n[yellow]⚠ {len(blocked_keys)} key(s) blocked by tombstones:[/yellow]")
             for key in sorted(blocked_keys):
@@ -457,7 +572,7 @@ def commit_hook(project_root):
             console.print("[dim]Run 'coenv undeprecate KEY' to allow resurrection.[/dim]\n")
 
         # Check for fuzzy matches against tombstones for NEW keys
-        new_keys = set(aggregated_keys.keys()) - example_keys_set - tombstoned
+        new_keys = aggregated_keys.keys() - example_keys_set - tombstoned
         fuzzy_matches = find_fuzzy_tombstone_matches(new_keys, tombstoned)
 
         if fuzzy_matches:
@@ -471,21 +586,26 @@ def commit_hook(project_root):
     filtered_keys = {k: v for k, v in aggregated_keys.items() if k not in tombstoned}
     updated_content, syncer = sync_aggregated(filtered_keys, example_path)
 
-    # Write updated .env.example
-    with open(example_path, 'w') as f:
-        f.write(updated_content)
+    # Write updated .env.example, leaving the file (and its mtime) alone only
+    # when the bytes on disk already match what would be written, line
+    # endings included, so e.g. a CRLF file is still normalized as before
+    if updated_content.replace('\n', os.linesep) != example_on_disk:
+        with open(example_path, 'w') as f:
+            f.write(updated_content)
 
     # Update metadata with source tracking (only for non-tombstoned keys)
     if Path(example_path).exists():
-        final_tombstoned = get_tombstoned_keys(parse(updated_content))
+        _, final_tombstoned = scan_keys_and_tombstones(updated_content)
     else:
         final_tombstoned = set()
 
-    synced_count = 0
-    for key, agg_key in aggregated_keys.items():
-        if key not in final_tombstoned:
-            metadata.track_key(key, source=agg_key.source)
-            synced_count += 1
+    synced = [
+        (key, agg_key.source)
+        for key, agg_key in aggregated_keys.items()
+        if key not in final_tombstoned
+    ]
+    metadata.track_keys_bulk(synced)
+    synced_count = len(synced)
 
     metadata.log_activity("sync", synced_count)
 
@@ -549,11 +669,14 @@ def exclude_file(filename, project_root):
             insert_idx = i
             break
 
-    tokens.insert(insert_idx, marker)
+    inserted = [marker]
 
     # Ensure a blank line after the marker if keys follow immediately.
-    if insert_idx + 1 < len(tokens) and tokens[insert_idx + 1].type == TokenType.KEY_VALUE:
-        tokens.insert(insert_idx + 1, Token(TokenType.BLANK_LINE, raw="\n"))
+    if insert_idx < len(tokens) and tokens[insert_idx].type == TokenType.KEY_VALUE:
+        inserted.append(Token(TokenType.BLANK_LINE, raw="\n"))
+
+    # Single slice assignment shifts the trailing tokens only once
+    tokens[insert_idx:insert_idx] = inserted
 
     example_path.write_text(write(tokens))
     console.print(f"[green]✓ Excluded {filename} from .env.example generation[/green]")
@@ -650,6 +773,27 @@ def undeprecate(key, project_root):
     console.print("[dim]This key can now be resurrected during commit-hook generation.[/dim]")
 
 
+GIT_HOOK_PREAMBLE = """#!/bin/sh
+set -e
+command -v coenv >/dev/null 2>&1 || { echo "coenv not found in PATH"; exit 1; }
+"""
+
+# Hook name -> script body (appended to GIT_HOOK_PREAMBLE)
+GIT_HOOKS = {
+    "pre-commit": """# CoEnv pre-commit hook
+coenv commit-hook
+git add .env.example
+""",
+    "post-merge": """# CoEnv post-merge hook
+coenv merge-hook
+""",
+    # Runs after rebase/amend
+    "post-rewrite": """# CoEnv post-rewrite hook
+coenv merge-hook
+""",
+}
+
+
 def init_project():
     """Initialize CoEnv in the current project."""
     console.print("[cyan]Initializing CoEnv...[/cyan]")
@@ -666,42 +810,10 @@ def init_project():
         hooks_dir = git_dir / "hooks"
         hooks_dir.mkdir(exist_ok=True)
 
-        # Pre-commit hook
-        pre_commit = hooks_dir / "pre-commit"
-        pre_commit_content = """#!/bin/sh
-set -e
-command -v coenv >/dev/null 2>&1 || { echo "coenv not found in PATH"; exit 1; }
-# CoEnv pre-commit hook
-coenv commit-hook
-git add .env.example
-"""
-        with open(pre_commit, 'w') as f:
-            f.write(pre_commit_content)
-        pre_commit.chmod(0o755)
-
-        # Post-merge hook
-        post_merge = hooks_dir / "post-merge"
-        post_merge_content = """#!/bin/sh
-set -e
-command -v coenv >/dev/null 2>&1 || { echo "coenv not found in PATH"; exit 1; }
-# CoEnv post-merge hook
-coenv merge-hook
-"""
-        with open(post_merge, 'w') as f:
-            f.write(post_merge_content)
-        post_merge.chmod(0o755)
-
-        # Post-rewrite hook (runs after rebase/amend)
-        post_rewrite = hooks_dir / "post-rewrite"
-        post_rewrite_content = """#!/bin/sh
-set -e
-command -v coenv >/dev/null 2>&1 || { echo "coenv not found in PATH"; exit 1; }
-# CoEnv post-rewrite hook
-coenv merge-hook
-"""
-        with open(post_rewrite, 'w') as f:
-            f.write(post_rewrite_content)
-        post_rewrite.chmod(0o755)
+        for hook_name, hook_body in GIT_HOOKS.items():
+            hook_path = hooks_dir / hook_name
+            hook_path.write_text(GIT_HOOK_PREAMBLE + hook_body)
+            hook_path.chmod(0o755)
 
         console.print("[green]✓ Installed git hooks (pre-commit, post-merge, post-rewrite)[/green]")
     else:
@@ -710,16 +822,14 @@ coenv merge-hook
     # Create .gitignore entry
     gitignore = Path(".gitignore")
     if gitignore.exists():
-        with open(gitignore, 'r') as f:
-            content = f.read()
+        content = gitignore.read_text()
 
         if '.env' not in content:
             with open(gitignore, 'a') as f:
                 f.write('\n# Environment variables\n.env\n')
             console.print("[green]✓ Added .env to .gitignore[/green]")
     else:
-        with open(gitignore, 'w') as f:
-            f.write('# Environment variables\n.env\n')
+        gitignore.write_text('# Environment variables\n.env\n')
         console.print("[green]✓ Created .gitignore with .env[/green]")
 
     console.print("\n[bold green]✓ CoEnv initialized successfully![/bold green]")
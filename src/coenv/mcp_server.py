@@ -8,36 +8,186 @@ Available tools:
 """
 
 import json
+import os
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict
-
-from .core.lexer import parse, get_keys
-from .core.discovery import discover_env_files, aggregate_env_files, get_example_path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
+
+from .core.lexer import parse_keys
+from .core.discovery import (
+    aggregate_env_files,
+    discover_env_files,
+    get_example_path,
+    scanned_dirs_unchanged,
+)
 from .core.excludes import parse_exclude_files
 from .core.metadata import MetadataStore
 
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install coenv[speedups])
+    orjson = None
+
+
+def _json_loads(data):
+    """Decode a JSON message, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumpb(obj: Any) -> bytes:
+    """Encode a JSON message to UTF-8 bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+# Resolved project root -> (metadata.json mtime_ns, store)
+_METADATA_STORES: Dict[str, Tuple[Optional[int], MetadataStore]] = {}
+_METADATA_LOCK = threading.Lock()
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True)
+class _ProjectContext:
+    """Paths derived from a project_root argument."""
+    root: Path  # Resolved project root
+    example_path: Path
+
+
+@lru_cache(maxsize=32)
+def _project_ctx(project_root: str) -> _ProjectContext:
+    """Resolve a project_root argument once and reuse it across tool calls."""
+    root = Path(project_root).resolve()
+    return _ProjectContext(root=root, example_path=get_example_path(str(root)))
+
+
+def _get_store(root: Path) -> MetadataStore:
+    """
+    Get the MetadataStore for a resolved project root, reusing it across calls.
+
+    The store is reloaded when metadata.json changes on disk (e.g. after a
+    commit hook ran), so cached owners never go stale.
+    """
+    key = str(root)
+
+    with _METADATA_LOCK:
+        cached = _METADATA_STORES.get(key)
+        if cached is not None:
+            mtime, store = cached
+            if _mtime_ns(store.metadata_file) == mtime:
+                return store
+
+        store = MetadataStore(key)
+        _METADATA_STORES[key] = (_mtime_ns(store.metadata_file), store)
+        return store
+
+
+@lru_cache(maxsize=128)
+def _parse_env_cached(path: str, mtime_ns: int, size: int) -> Tuple[str, Mapping[str, str]]:
+    """
+    Read and parse an env file; cached by (path, mtime, size).
+
+    Any change to the file changes its stat fingerprint, so stale entries
+    are never returned - they simply age out of the LRU.
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+    return content, MappingProxyType(parse_keys(content))
+
+
+def _read_env_file(path: Path) -> Tuple[str, Mapping[str, str]]:
+    """Return (content, read-only key-value mapping) for an env file."""
+    st = os.stat(path)
+    return _parse_env_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _read_env_keys(path: Path) -> Mapping[str, str]:
+    return _read_env_file(path)[1]
+
+
+def _read_example(example_path: Path) -> Tuple[str, Mapping[str, str]]:
+    """Return (content, keys) of .env.example, or empty values if it is missing."""
+    try:
+        return _read_env_file(example_path)
+    except FileNotFoundError:
+        return "", MappingProxyType({})
+
+
+# (resolved project root, excluded files) -> (scanned directory mtimes, env files)
+_DISCOVERY_CACHE: Dict[Tuple[str, FrozenSet[str]], Tuple[Dict[str, Optional[int]], List[Path]]] = {}
+# One lock per project root, so a scan only blocks calls for the same project
+_DISCOVERY_LOCKS: Dict[str, threading.Lock] = {}
+_DISCOVERY_LOCKS_GUARD = threading.Lock()
+
+
+def _discovery_lock(root_key: str) -> threading.Lock:
+    with _DISCOVERY_LOCKS_GUARD:
+        lock = _DISCOVERY_LOCKS.get(root_key)
+        if lock is None:
+            lock = _DISCOVERY_LOCKS[root_key] = threading.Lock()
+        return lock
 
-def get_status_tool(project_root: str = ".") -> Dict[str, Any]:
+
+def _discover_cached(root: Path, exclude_files: set) -> List[Path]:
+    """
+    discover_env_files for a resolved root, reused while every directory
+    the scan visited is unchanged.
+
+    Adding, removing or renaming an env file (or a subdirectory) bumps its
+    parent directory's mtime, which forces a rescan.
+    """
+    root_key = str(root)
+    key = (root_key, frozenset(exclude_files))
+
+    with _discovery_lock(root_key):
+        cached = _DISCOVERY_CACHE.get(key)
+        if cached is not None:
+            dir_mtimes, files = cached
+            if scanned_dirs_unchanged(root_key, dir_mtimes):
+                return list(files)
+
+        dir_mtimes = {}
+        files = discover_env_files(
+            root_key, exclude_files=exclude_files, dir_mtimes=dir_mtimes
+        )
+        _DISCOVERY_CACHE[key] = (dir_mtimes, files)
+        return list(files)
+
+
+def get_status_tool(project_root: str = ".", sort_keys: bool = False) -> Dict[str, Any]:
     """
     Get environment variable status.
 
+    Args:
+        project_root: Project root directory
+        sort_keys: Return keys alphabetically instead of in discovery order
+
     Returns:
         Dictionary with status information including discovered files and sources
     """
-    metadata = MetadataStore(project_root)
+    ctx = _project_ctx(project_root)
+    root, example_path = ctx.root, ctx.example_path
 
-    example_path = get_example_path(project_root)
+    metadata = _get_store(root)
 
-    excluded_files = set()
-    example_content = ""
-    if example_path.exists():
-        with open(example_path, 'r') as f:
-            example_content = f.read()
-        excluded_files = parse_exclude_files(example_content)
+    example_content, example_keys = _read_example(example_path)
+    excluded_files = parse_exclude_files(example_content) if example_content else set()
 
     # Discover and aggregate all .env* files
-    env_files = discover_env_files(project_root, exclude_files=excluded_files)
+    env_files = _discover_cached(root, excluded_files)
 
     if not env_files:
         return {
@@ -45,34 +195,37 @@ def get_status_tool(project_root: str = ".") -> Dict[str, Any]:
             'error': 'No .env files found'
         }
 
-    aggregated_keys = aggregate_env_files(env_files, project_root)
-    root = Path(project_root)
+    aggregated_keys = aggregate_env_files(env_files, str(root), load_keys=_read_env_keys)
+    # Discovered paths live under the resolved root, so a string prefix check
+    # is enough to make them relative (no Path objects or exceptions needed).
+    prefix = os.path.join(str(root), "")
+    cut = len(prefix)
     discovered_files = []
     for path in env_files:
-        try:
-            discovered_files.append(str(path.relative_to(root)))
-        except ValueError:
-            discovered_files.append(path.name)
-
-    # Parse .env.example if it exists
-    example_keys = {}
-    if example_content:
-        example_keys = get_keys(parse(example_content))
+        s = os.fspath(path)
+        discovered_files.append(s[cut:] if s.startswith(prefix) else path.name)
 
     # Build status for each key
+    keys = sorted(aggregated_keys) if sort_keys else list(aggregated_keys)
+    key_metadata = metadata.get_many(keys)
+    # example_keys is a read-only mapping proxy; membership on a plain
+    # frozenset avoids going through the proxy for every key.
+    example_key_set = frozenset(example_keys)
     keys_status = []
-    for key in sorted(aggregated_keys.keys()):
+    synced = 0
+    for key in keys:
         agg_key = aggregated_keys[key]
         value = agg_key.value
 
         # Determine repo status
-        repo_status = "synced" if key in example_keys else "missing"
+        repo_status = "synced" if key in example_key_set else "missing"
+        synced += repo_status == "synced"
 
         # Check health
         health = "empty" if not value or value.strip() == "" else "set"
 
         # Get owner
-        key_meta = metadata.get_key_metadata(key)
+        key_meta = key_metadata.get(key)
         owner = key_meta.owner if key_meta else "unknown"
 
         keys_status.append({
@@ -88,13 +241,22 @@ def get_status_tool(project_root: str = ".") -> Dict[str, Any]:
         'success': True,
         'discovered_files': discovered_files,
         'total_keys': len(aggregated_keys),
-        'synced_keys': sum(1 for k in aggregated_keys if k in example_keys),
-        'missing_keys': sum(1 for k in aggregated_keys if k not in example_keys),
+        'synced_keys': synced,
+        'missing_keys': len(aggregated_keys) - synced,
         'excluded_files': list(sorted(excluded_files)),
         'keys': keys_status,
     }
 
 
+# Tool name -> handler taking the raw arguments dict
+_TOOLS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    'get_status': lambda args: get_status_tool(
+        args.get('project_root', '.'),
+        sort_keys=bool(args.get('sort_keys', False)),
+    ),
+}
+
+
 # MCP Server Implementation
 def handle_tool_call(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -107,78 +269,144 @@ def handle_tool_call(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any
     Returns:
         Tool result dictionary
     """
-    project_root = arguments.get('project_root', '.')
-
-    if tool_name == 'get_status':
-        return get_status_tool(project_root)
-    else:
+    tool = _TOOLS.get(tool_name)
+    if tool is None:
         return {
             'success': False,
             'error': f'Unknown tool: {tool_name}'
         }
+    return tool(arguments)
 
 
-def run_server():
+def _iter_messages(stream, chunk_size: int = 65536) -> Iterator[bytes]:
     """
-    Run the MCP server.
+    Yield newline-delimited messages from a binary stream.
 
-    Reads JSON-RPC messages from stdin and writes responses to stdout.
+    Reads whatever is available in large chunks (read1) and splits frames
+    out of a byte buffer, instead of decoding stdin line by line.
     """
-    # Server metadata
-    server_info = {
-        'name': 'coenv',
-        'version': '0.1.0',
-        'tools': [
-            {
-                'name': 'get_status',
-                'description': 'Get environment variable status from all .env* files, including source tracking and sync state',
-                'parameters': {
-                    'type': 'object',
-                    'properties': {
-                        'project_root': {
-                            'type': 'string',
-                            'description': 'Project root directory (default: current directory)',
-                            'default': '.'
-                        }
+    buffer = bytearray()
+    while True:
+        chunk = stream.read1(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+
+        start = 0
+        end = buffer.find(b"\n")
+        while end != -1:
+            yield bytes(buffer[start:end])
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        del buffer[:start]
+
+    # Final message without a trailing newline
+    if buffer:
+        yield bytes(buffer)
+
+
+# Server metadata
+SERVER_INFO = {
+    'name': 'coenv',
+    'version': '0.1.0',
+    'tools': [
+        {
+            'name': 'get_status',
+            'description': 'Get environment variable status from all .env* files, including source tracking and sync state',
+            'parameters': {
+                'type': 'object',
+                'properties': {
+                    'project_root': {
+                        'type': 'string',
+                        'description': 'Project root directory (default: current directory)',
+                        'default': '.'
+                    },
+                    'sort_keys': {
+                        'type': 'boolean',
+                        'description': 'Sort keys alphabetically (default: discovery order)',
+                        'default': False
                     }
                 }
-            },
-        ]
+            }
+        },
+    ]
+}
+
+# Encoded once at import; written verbatim on startup
+_SERVER_INFO_WIRE = _json_dumpb(SERVER_INFO) + b"\n"
+
+
+def _error_response(request_id: Any, exc: BaseException) -> Dict[str, Any]:
+    return {
+        'jsonrpc': '2.0',
+        'id': request_id,
+        'error': {'code': -32603, 'message': str(exc)}
     }
 
+
+def run_server(max_workers: int = 4):
+    """
+    Run the MCP server.
+
+    Reads JSON-RPC messages from stdin and writes responses to stdout.
+    Tool calls run on a small thread pool so a slow call doesn't hold up
+    the ones behind it; responses may therefore arrive out of order and
+    are matched to requests by id.
+
+    Args:
+        max_workers: Number of tool calls that may run concurrently
+    """
     # Simple stdio-based JSON-RPC server
-    print(json.dumps(server_info), file=sys.stderr)
+    sys.stderr.buffer.write(_SERVER_INFO_WIRE)
     sys.stderr.flush()
 
+    stdout_lock = threading.Lock()
+
+    def send(response: Dict[str, Any]):
+        payload = _json_dumpb(response) + b"\n"
+        # One writer at a time keeps each response on its own line
+        with stdout_lock:
+            sys.stdout.buffer.write(payload)
+            sys.stdout.buffer.flush()
+
+    def on_done(request_id: Any, future: Future):
+        try:
+            result = future.result()
+        except Exception as exc:
+            send(_error_response(request_id, exc))
+            return
+
+        send({
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'result': result
+        })
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
     try:
-        for line in sys.stdin:
+        for line in _iter_messages(sys.stdin.buffer):
             if not line.strip():
                 continue
 
             try:
-                request = json.loads(line)
+                request = _json_loads(line)
 
                 if request.get('method') == 'tools/call':
                     params = request.get('params', {})
                     tool_name = params.get('name')
                     arguments = params.get('arguments', {})
 
-                    result = handle_tool_call(tool_name, arguments)
-
-                    response = {
-                        'jsonrpc': '2.0',
-                        'id': request.get('id'),
-                        'result': result
-                    }
-
-                    print(json.dumps(response))
-                    sys.stdout.flush()
+                    future = executor.submit(handle_tool_call, tool_name, arguments)
+                    future.add_done_callback(partial(on_done, request.get('id')))
 
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
 
     except KeyboardInterrupt:
         pass
+    finally:
+        # Let in-flight calls finish and write their responses
+        executor.shutdown(wait=True)
 
 
 if __name__ == '__main__':
@@ -2,18 +2,28 @@
 Tests for the discovery module (multi-file discovery and aggregation).
 """
 
+import os
 import pytest
 import tempfile
+import time
 from pathlib import Path
 from coenv.core.discovery import (
     get_file_priority,
     discover_env_files,
     aggregate_env_files,
     get_example_path,
+    scanned_dirs_unchanged,
     AggregatedKey,
 )
 
 
+def _backdate_dirs(root):
+    """Move every directory's mtime well clear of the racy window."""
+    old = time.time() - 60
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (old, old))
+
+
 class TestFilePriority:
     """Test file priority ordering."""
 
@@ -122,6 +132,53 @@ class TestDiscoverEnvFiles:
             files = discover_env_files(tmpdir)
             assert files == []
 
+    def test_scan_cache_picks_up_changes(self):
+        """Cached scans should notice new files and exclusion changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("KEY=value\n")
+            (Path(tmpdir) / ".env.local").write_text("KEY=value\n")
+            (Path(tmpdir) / ".coenv").mkdir()
+            _backdate_dirs(tmpdir)
+
+            files = discover_env_files(tmpdir, exclude_files={".env.local"}, use_cache=True)
+            assert [f.name for f in files] == [".env"]
+
+            nested = Path(tmpdir) / "app"
+            nested.mkdir()
+            (nested / ".env.development").write_text("KEY=value\n")
+
+            files = discover_env_files(tmpdir, use_cache=True)
+            assert sorted(str(f.relative_to(tmpdir)) for f in files) == [
+                ".env", ".env.local", "app/.env.development"
+            ]
+
+    def test_dir_mtimes_notice_files_in_existing_subdirectories(self):
+        """A new env file in any scanned directory should invalidate the scan."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("KEY=value\n")
+            nested = Path(tmpdir) / "apps" / "web"
+            nested.mkdir(parents=True)
+            (Path(tmpdir) / ".coenv").mkdir()
+            _backdate_dirs(tmpdir)
+
+            dir_mtimes = {}
+            discover_env_files(tmpdir, dir_mtimes=dir_mtimes)
+            assert "apps/web" in dir_mtimes
+            assert scanned_dirs_unchanged(tmpdir, dir_mtimes)
+
+            (nested / ".env").write_text("KEY=value\n")
+            assert not scanned_dirs_unchanged(tmpdir, dir_mtimes)
+
+    def test_recently_modified_dirs_are_not_trusted(self):
+        """Directories changed just before the scan could hide a same-tick edit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("KEY=value\n")
+
+            dir_mtimes = {}
+            discover_env_files(tmpdir, dir_mtimes=dir_mtimes)
+            assert dir_mtimes["."] is None
+            assert not scanned_dirs_unchanged(tmpdir, dir_mtimes)
+
 
 class TestAggregateEnvFiles:
     """Test key aggregation from multiple files."""
@@ -190,6 +247,23 @@ class TestAggregateEnvFiles:
         result = aggregate_env_files([], None)
         assert result == {}
 
+    def test_custom_key_loader(self):
+        """load_keys should replace reading and parsing each file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_path = Path(tmpdir) / ".env"
+            env_path.write_text("KEY=from_disk\n")
+
+            loaded = []
+
+            def load_keys(path):
+                loaded.append(path)
+                return {"KEY": "from_loader"}
+
+            result = aggregate_env_files([env_path], tmpdir, load_keys=load_keys)
+
+            assert loaded == [env_path]
+            assert result["KEY"].value == "from_loader"
+
 
 class TestGetExamplePath:
     """Test example path generation."""
@@ -17,3 +17,9 @@ def test_parse_exclude_files_basic():
 def test_parse_exclude_files_ignores_other_comments():
     content = "# Just a comment\n# [EXCLUDE_FILE] .env.local\n"
     assert parse_exclude_files(content) == {".env.local"}
+
+
+def test_parse_exclude_files_line_endings_and_separators():
+    content = "KEY=value\r\n  # [EXCLUDE_FILE]: .env.local  \r\n# note [EXCLUDE_FILE] apps/web/.env\r\n"
+    assert parse_exclude_files(content) == {".env.local", "apps/web/.env"}
+    assert parse_exclude_files(content.replace("\r\n", "\r")) == {".env.local", "apps/web/.env"}
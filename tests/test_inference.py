@@ -63,6 +63,12 @@ class TestSecretDetection:
         """HashiCorp Vault references should be detected."""
         assert is_secret("vault:secret/data/myapp")
 
+    def test_entropy_needs_enough_characters(self):
+        """Short values can't reach the entropy threshold, even if all distinct."""
+        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        assert not is_secret(alphabet[:22])
+        assert is_secret(alphabet[:23])
+
     def test_not_secret_simple_value(self):
         """Simple config values should not be secrets."""
         assert not is_secret("development")
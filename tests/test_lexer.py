@@ -12,6 +12,7 @@ from coenv.core.lexer import (
     parse,
     write,
     get_keys,
+    parse_keys,
     update_value,
 )
 
@@ -247,6 +248,20 @@ KEY2=value2
             "KEY2": "value2",
         }
 
+    def test_parse_keys_matches_get_keys(self):
+        """parse_keys should agree with get_keys(parse(...)), including order."""
+        content = """# Comment
+export KEY1="quoted value"
+  KEY2 = value2  
+not a key line
+=no_key
+KEY1=override
+EMPTY=
+"""
+        result = parse_keys(content)
+        assert result == get_keys(parse(content))
+        assert list(result) == list(get_keys(parse(content)))
+
 
 class TestUpdateValue:
     """Test value updating in token stream."""
@@ -296,6 +311,14 @@ KEY3=value3
         result = write(updated)
         assert result == content
 
+    def test_update_duplicate_key_updates_all(self):
+        """Every occurrence of a duplicated key should be updated."""
+        content = "KEY=a\nOTHER=b\nexport KEY=c"
+        tokens = parse(content)
+        updated = update_value(tokens, "KEY", "new")
+        assert write(updated) == "KEY=new\nOTHER=b\nexport KEY=new"
+        assert write(tokens) == content
+
 
 class TestEdgeCases:
     """Test edge cases and special scenarios."""
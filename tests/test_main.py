@@ -0,0 +1,96 @@
+"""
+Tests for the git output parsers in the CLI module.
+"""
+
+from coenv.main import _parse_blame_incremental, _parse_cat_file_batch
+
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+class TestParseBlameIncremental:
+    """Test parsing of 'git blame --incremental' output."""
+
+    def test_attributes_line_ranges_to_authors(self):
+        """Each group's line range should map to its commit's author."""
+        output = [
+            f"{SHA_A} 1 1 2\n",
+            "author Alice\n",
+            "author-mail <alice@example.com>\n",
+            "summary First\n",
+            "filename .env.example\n",
+            f"{SHA_B} 3 3 1\n",
+            "author Bob\n",
+            "author-mail <bob@example.com>\n",
+            "summary Second\n",
+            "previous " + SHA_A + " .env.example\n",
+            "filename .env.example\n",
+        ]
+        assert _parse_blame_incremental(output) == {1: "Alice", 2: "Alice", 3: "Bob"}
+
+    def test_repeated_commit_reuses_author(self):
+        """Later groups of a commit carry no author line and reuse the first."""
+        output = [
+            f"{SHA_A} 1 1 1\n",
+            "author Alice\n",
+            "filename .env.example\n",
+            f"{SHA_B} 2 2 1\n",
+            "author Bob\n",
+            "filename .env.example\n",
+            f"{SHA_A} 3 3 2\n",
+            "filename .env.example\n",
+        ]
+        assert _parse_blame_incremental(output) == {
+            1: "Alice", 2: "Bob", 3: "Alice", 4: "Alice"
+        }
+
+    def test_truncated_group_is_ignored(self):
+        """A group cut off before its filename line should not be attributed."""
+        output = [
+            f"{SHA_A} 1 1 1\n",
+            "author Alice\n",
+            "filename .env.example\n",
+            f"{SHA_B} 2 2 5\n",
+            "author Bob\n",
+        ]
+        assert _parse_blame_incremental(output) == {1: "Alice"}
+
+    def test_empty_author_is_unknown(self):
+        """An empty author name should be reported as unknown."""
+        output = [
+            f"{SHA_A} 1 1 1\n",
+            "author \n",
+            "filename .env.example\n",
+        ]
+        assert _parse_blame_incremental(output) == {1: "unknown"}
+
+
+class TestParseCatFileBatch:
+    """Test parsing of 'git cat-file --batch' output."""
+
+    def test_missing_object(self):
+        """A missing object should come back as None."""
+        output = b"ORIG_HEAD:.env.example missing\n"
+        assert _parse_cat_file_batch(output, 1) == [None]
+
+    def test_blob_containing_newlines(self):
+        """Blob contents are read by size, not up to the next newline."""
+        blob = b"KEY=1\n\nOTHER=2\n"
+        output = SHA_A.encode() + b" blob %d\n" % len(blob) + blob + b"\n"
+        assert _parse_cat_file_batch(output, 1) == ["KEY=1\n\nOTHER=2\n"]
+
+    def test_multiple_objects(self):
+        """Replies should be matched to requests in order, including gaps."""
+        first = b"A=1\n"
+        last = b"B=2\nC=3"
+        output = (
+            SHA_A.encode() + b" blob %d\n" % len(first) + first + b"\n"
+            + b"HEAD@{1}:.env.example missing\n"
+            + SHA_B.encode() + b" blob %d\n" % len(last) + last + b"\n"
+        )
+        assert _parse_cat_file_batch(output, 3) == ["A=1\n", None, "B=2\nC=3"]
+
+    def test_truncated_output(self):
+        """Replies missing from the output should come back as None."""
+        assert _parse_cat_file_batch(b"", 2) == [None, None]
@@ -0,0 +1,109 @@
+"""
+Tests for the MCP server (JSON-RPC loop and cached status).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import coenv
+from coenv.mcp_server import get_status_tool
+
+
+def _run_server(messages: bytes) -> list:
+    """Feed raw bytes to the server over pipes and return the parsed responses."""
+    env = dict(os.environ)
+    src_dir = str(Path(coenv.__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+
+    result = subprocess.run(
+        [sys.executable, "-m", "coenv.mcp_server"],
+        input=messages,
+        capture_output=True,
+        env=env,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+    return [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+
+
+def _call(request_id, arguments, name="get_status") -> bytes:
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    }).encode()
+
+
+class TestRunServer:
+    """Test the stdio JSON-RPC loop."""
+
+    def test_responses_pair_with_request_ids(self):
+        """Every request should get exactly one response carrying its id."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("KEY=value\n")
+            (Path(tmpdir) / ".env.example").write_text("KEY=<value>\n")
+
+            ids = list(range(1, 9))
+            messages = [_call(i, {"project_root": tmpdir}) for i in ids]
+            messages.insert(3, b"")              # blank line
+            messages.insert(5, b"{not json")     # malformed request
+            # Last message has no trailing newline
+            responses = _run_server(b"\n".join(messages))
+
+        by_id = {response["id"]: response for response in responses}
+        assert len(responses) == len(ids)
+        assert sorted(by_id) == ids
+        for response in responses:
+            assert response["result"]["success"] is True
+            assert response["result"]["discovered_files"] == [".env"]
+
+    def test_tool_errors_become_error_responses(self):
+        """A tool call that raises should answer with a -32603 error for its id."""
+        responses = _run_server(b"\n".join([
+            _call("bad", ["not", "a", "dict"]),
+            _call("unknown", {}, name="no_such_tool"),
+        ]) + b"\n")
+
+        by_id = {response["id"]: response for response in responses}
+        assert by_id["bad"]["error"]["code"] == -32603
+        assert by_id["unknown"]["result"]["success"] is False
+
+
+class TestStatusCaching:
+    """Test that cached status follows file edits."""
+
+    def test_status_reflects_edited_files(self):
+        """Edits to env files and .env.example should show up on the next call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_path = Path(tmpdir) / ".env"
+            example_path = Path(tmpdir) / ".env.example"
+            env_path.write_text("KEY=value\n")
+
+            status = get_status_tool(tmpdir)
+            assert [k["key"] for k in status["keys"]] == ["KEY"]
+            assert status["synced_keys"] == 0
+
+            env_path.write_text("KEY=value\nOTHER=value\n")
+            example_path.write_text("KEY=<value>\n")
+
+            status = get_status_tool(tmpdir)
+            assert [k["key"] for k in status["keys"]] == ["KEY", "OTHER"]
+            assert status["synced_keys"] == 1
+
+    def test_status_picks_up_new_env_file(self):
+        """A new env file in an existing subdirectory should be discovered."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / ".env").write_text("KEY=value\n")
+            nested = Path(tmpdir) / "apps" / "web"
+            nested.mkdir(parents=True)
+
+            assert get_status_tool(tmpdir)["discovered_files"] == [".env"]
+
+            (nested / ".env").write_text("WEB_KEY=value\n")
+            files = get_status_tool(tmpdir)["discovered_files"]
+            assert sorted(files) == [".env", os.path.join("apps", "web", ".env")]
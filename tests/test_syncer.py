@@ -8,13 +8,14 @@ from coenv.core.syncer import (
     find_fuzzy_match,
     parse_tombstone,
     get_tombstoned_keys,
+    scan_keys_and_tombstones,
     add_tombstone,
     remove_tombstone,
     Syncer,
     DEPRECATED_MARKER,
     TOMBSTONE_PREFIX,
 )
-from coenv.core.lexer import parse
+from coenv.core.lexer import parse, get_keys
 
 
 class TestFuzzyMatching:
@@ -25,6 +26,11 @@ class TestFuzzyMatching:
         match = find_fuzzy_match("DATABASE_URL", ["DATABASE_URL", "API_KEY"])
         assert match == "DATABASE_URL"
 
+    def test_case_insensitive_exact_match_first_wins(self):
+        """The first case-insensitive exact match should win."""
+        candidates = ["DATABASE_URLS", "database_url", "DATABASE_URL"]
+        assert find_fuzzy_match("DATABASE_URL", candidates) == "database_url"
+
     def test_similar_match(self):
         """Very similar keys should match."""
         match = find_fuzzy_match("DB_PASSWORD", ["DATABASE_PASSWORD", "API_KEY"])
@@ -52,6 +58,28 @@ class TestFuzzyMatching:
         match = find_fuzzy_match("KEY", [])
         assert match is None
 
+    def test_prefilter_does_not_change_result(self, monkeypatch):
+        """The optional rapidfuzz prefilter should pick the same match as plain difflib."""
+        import random
+        from coenv.core import syncer
+
+        rng = random.Random(0)
+        alphabet = "ABCDE_"
+        words = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            for _ in range(200)
+        ]
+
+        with_prefilter = [find_fuzzy_match(w, words[:50]) for w in words]
+        monkeypatch.setattr(syncer, "_rapidfuzz", lambda: None)
+        without_prefilter = [find_fuzzy_match(w, words[:50]) for w in words]
+
+        assert with_prefilter == without_prefilter
+
+    def test_punctuation_heavy_keys_still_match(self):
+        """Underscores count toward similarity, as they do in difflib."""
+        assert find_fuzzy_match("____AB", ["____CD"]) == "____CD"
+
 
 class TestTombstoneParsing:
     """Test tombstone entry parsing."""
@@ -124,6 +152,25 @@ class TestGetTombstonedKeys:
         result = get_tombstoned_keys(tokens)
         assert result == {"OLD_KEY1", "OLD_KEY2"}
 
+    def test_scan_matches_token_based_extraction(self):
+        """scan_keys_and_tombstones should agree with parse-based helpers."""
+        content = f"""# [TOMBSTONE] EARLY - Deprecated on: 2024-01-15
+export KEY1=value1
+ KEY2 = "value2"
+=orphan
+# COMMENTED=out
+
+{DEPRECATED_MARKER}
+# {TOMBSTONE_PREFIX} OLD_KEY - Deprecated on: 2024-01-15
+# {TOMBSTONE_PREFIX} BAD_DATE - Deprecated on: soon
+KEY3=value3
+"""
+        tokens = parse(content)
+        keys, tombstoned = scan_keys_and_tombstones(content)
+        assert keys == set(get_keys(tokens))
+        assert tombstoned == get_tombstoned_keys(tokens)
+        assert tombstoned == {"OLD_KEY"}
+
 
 class TestAddTombstone:
     """Test adding tombstones."""